@@ -0,0 +1,148 @@
+"""
+Data export helpers for Exoplanet Compilation
+
+Shared writers used by the data collector and the demo data generator,
+and a loader for the files they produce. Faster optional libraries are
+used when installed, with pandas as the fallback.
+"""
+
+import os
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to pandas' JSON writer
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    # pyarrow is optional; fall back to pandas' writers
+    pa = None
+
+
+# Rows converted and written per chunk by the CSV and Parquet writers
+CHUNKSIZE = 50_000
+
+
+def save_csv(data, filename, engine='pyarrow', chunksize=CHUNKSIZE):
+    """
+    Save a DataFrame as CSV without the index.
+    
+    Rows are converted and written in chunks to bound peak memory.
+    
+    Parameters:
+    -----------
+    data : pandas.DataFrame
+        Data to save
+    filename : str
+        Output CSV file path
+    engine : str
+        'pyarrow' (default) uses pyarrow's multithreaded C++ writer when
+        available; 'pandas' always uses DataFrame.to_csv
+    chunksize : int
+        Number of rows formatted per write (default: 50,000)
+    """
+    if engine == 'pyarrow' and pa is not None:
+        try:
+            schema = pa.Schema.from_pandas(data, preserve_index=False)
+        except pa.ArrowException:
+            # Mixed-type object columns cannot be converted; use pandas
+            schema = None
+        if schema is not None:
+            with pa_csv.CSVWriter(filename, schema) as writer:
+                for chunk in _iter_tables(data, schema, chunksize):
+                    writer.write_table(chunk)
+            return
+    data.to_csv(filename, index=False, chunksize=chunksize)
+
+
+def save_json_records(data, filename):
+    """
+    Save a DataFrame as a JSON array of records.
+    
+    Parameters:
+    -----------
+    data : pandas.DataFrame
+        Data to save
+    filename : str
+        Output JSON file path
+    """
+    if orjson is not None:
+        # Keep NumPy scalars (rather than to_dict's Python floats) so that
+        # float32 columns are written with their shortest representation
+        columns = [data[col].to_numpy() for col in data.columns]
+        records = [dict(zip(data.columns, row)) for row in zip(*columns)]
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        data.to_json(filename, orient='records')
+
+
+def save_parquet(data, filename, compression='zstd', chunksize=CHUNKSIZE):
+    """
+    Save a DataFrame as a Parquet file.
+    
+    Column dtypes are preserved; categorical columns are stored with
+    dictionary encoding. Each chunk of rows becomes one row group.
+    
+    Parameters:
+    -----------
+    data : pandas.DataFrame
+        Data to save
+    filename : str
+        Output Parquet file path
+    compression : str
+        Parquet compression codec (default: 'zstd')
+    chunksize : int
+        Number of rows converted per write (default: 50,000)
+    """
+    if pa is not None:
+        schema = pa.Schema.from_pandas(data, preserve_index=False)
+        with pq.ParquetWriter(filename, schema, compression=compression) as writer:
+            for chunk in _iter_tables(data, schema, chunksize):
+                writer.write_table(chunk)
+    else:
+        # Let pandas pick any other installed Parquet engine (e.g. fastparquet)
+        data.to_parquet(filename, index=False, compression=compression)
+
+
+def load_saved_data(filename):
+    """
+    Load a dataset saved by save_data, preferring its Parquet copy.
+    
+    The Parquet file (the CSV name with a .parquet extension) keeps the
+    saved dtypes and needs no parsing, so it is read whenever it is at
+    least as new as the CSV and a Parquet engine is installed.
+    
+    Parameters:
+    -----------
+    filename : str
+        Path of the saved CSV file
+    
+    Returns:
+    --------
+    pandas.DataFrame
+        The saved dataset; FileNotFoundError is raised if neither file
+        exists
+    """
+    parquet_filename = filename.replace('.csv', '.parquet')
+    if parquet_filename != filename and os.path.exists(parquet_filename):
+        if (not os.path.exists(filename)
+                or os.path.getmtime(parquet_filename) >= os.path.getmtime(filename)):
+            try:
+                return pd.read_parquet(parquet_filename)
+            except ImportError:
+                # No Parquet engine installed; read the CSV instead
+                pass
+    return pd.read_csv(filename)
+
+
+def _iter_tables(data, schema, chunksize):
+    """Yield consecutive row slices of a DataFrame as pyarrow Tables."""
+    for start in range(0, len(data), chunksize):
+        yield pa.Table.from_pandas(data.iloc[start:start + chunksize],
+                                   schema=schema, preserve_index=False)
@@ -5,8 +5,47 @@ Creates sample exoplanet data for demonstration and testing purposes
 when network access is unavailable.
 """
 
+from io import StringIO
 import pandas as pd
 import numpy as np
+from data_export import save_csv, save_json_records, save_parquet
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional; large demo sets fall back to plain NumPy
+    njit = None
+
+
+# Famous real exoplanets always included in the demo data. Radii and masses
+# are in Jupiter units: Proxima Centauri b ~1.1 R_Earth / ~1.3 M_Earth,
+# TRAPPIST-1e ~0.92 R_Earth / ~0.77 M_Earth, Kepler-452b ~1.6 R_Earth / ~5 M_Earth
+_FAMOUS_PLANETS_CSV = """\
+planet_name,host_star,discovery_method,discovery_year,orbital_period_days,planet_radius_jupiter,planet_mass_jupiter,orbital_distance_au,eccentricity,equilibrium_temp_k,stellar_distance_pc,stellar_mass_solar,stellar_radius_solar,stellar_temp_k,ra_deg,dec_deg,data_source
+Proxima Centauri b,Proxima Centauri,Radial Velocity,2016,11.186,0.099,0.004,0.0485,0.02,234,1.3,0.12,0.154,3042,217.4,-62.7,Demo Data
+TRAPPIST-1e,TRAPPIST-1,Transit,2017,6.1,0.083,0.002,0.028,0.0,246,12.5,0.089,0.121,2566,346.6,-5.0,Demo Data
+Kepler-452b,Kepler-452,Transit,2015,384.8,0.142,0.016,1.046,0.0,265,430,1.04,1.11,5757,292.9,44.3,Demo Data
+51 Pegasi b,51 Pegasi,Radial Velocity,1995,4.23,1.2,0.47,0.0527,0.013,1284,15.4,1.11,1.24,5793,344.4,20.8,Demo Data
+HD 189733 b,HD 189733,Transit,2005,2.22,1.14,1.13,0.031,0.0,1201,19.8,0.82,0.76,4875,300.2,22.7,Demo Data
+"""
+
+# Parsed once at import rather than rebuilt on every call
+_FAMOUS_PLANETS = pd.read_csv(StringIO(_FAMOUS_PLANETS_CSV))
+
+
+# Minimum number of random planets for which the numba kernel is used
+JIT_MIN_PLANETS = 50_000
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _equilibrium_temp_jit(stellar_radius, stellar_temp, orbital_distance):
+        """Equilibrium temperature in one fused pass, without NumPy temporaries."""
+        out = np.empty_like(orbital_distance)
+        for i in prange(out.size):
+            stellar_luminosity = stellar_radius[i] ** 2 * (stellar_temp[i] / 5778.0) ** 4
+            out[i] = 279.0 * np.sqrt(np.sqrt(stellar_luminosity)) / np.sqrt(orbital_distance[i])
+        return out
+else:
+    _equilibrium_temp_jit = None
 
 
 def generate_demo_data(num_planets=100):
@@ -23,177 +62,96 @@ def generate_demo_data(num_planets=100):
     pandas.DataFrame
         Sample exoplanet data
     """
-    np.random.seed(42)  # For reproducibility
-    
-    # Famous real exoplanets to include
-    famous_planets = [
-        {
-            'planet_name': 'Proxima Centauri b',
-            'host_star': 'Proxima Centauri',
-            'discovery_method': 'Radial Velocity',
-            'discovery_year': 2016,
-            'orbital_period_days': 11.186,
-            'planet_radius_jupiter': 0.099,  # ~1.1 Earth radii
-            'planet_mass_jupiter': 0.004,    # ~1.3 Earth masses
-            'orbital_distance_au': 0.0485,
-            'eccentricity': 0.02,
-            'equilibrium_temp_k': 234,
-            'stellar_distance_pc': 1.3,
-            'stellar_mass_solar': 0.12,
-            'stellar_radius_solar': 0.154,
-            'stellar_temp_k': 3042,
-            'ra_deg': 217.4,
-            'dec_deg': -62.7,
-            'data_source': 'Demo Data'
-        },
-        {
-            'planet_name': 'TRAPPIST-1e',
-            'host_star': 'TRAPPIST-1',
-            'discovery_method': 'Transit',
-            'discovery_year': 2017,
-            'orbital_period_days': 6.1,
-            'planet_radius_jupiter': 0.083,  # ~0.92 Earth radii
-            'planet_mass_jupiter': 0.002,    # ~0.77 Earth masses
-            'orbital_distance_au': 0.028,
-            'eccentricity': 0.0,
-            'equilibrium_temp_k': 246,
-            'stellar_distance_pc': 12.5,
-            'stellar_mass_solar': 0.089,
-            'stellar_radius_solar': 0.121,
-            'stellar_temp_k': 2566,
-            'ra_deg': 346.6,
-            'dec_deg': -5.0,
-            'data_source': 'Demo Data'
-        },
-        {
-            'planet_name': 'Kepler-452b',
-            'host_star': 'Kepler-452',
-            'discovery_method': 'Transit',
-            'discovery_year': 2015,
-            'orbital_period_days': 384.8,
-            'planet_radius_jupiter': 0.142,  # ~1.6 Earth radii
-            'planet_mass_jupiter': 0.016,    # ~5 Earth masses
-            'orbital_distance_au': 1.046,
-            'eccentricity': 0.0,
-            'equilibrium_temp_k': 265,
-            'stellar_distance_pc': 430,
-            'stellar_mass_solar': 1.04,
-            'stellar_radius_solar': 1.11,
-            'stellar_temp_k': 5757,
-            'ra_deg': 292.9,
-            'dec_deg': 44.3,
-            'data_source': 'Demo Data'
-        },
-        {
-            'planet_name': '51 Pegasi b',
-            'host_star': '51 Pegasi',
-            'discovery_method': 'Radial Velocity',
-            'discovery_year': 1995,
-            'orbital_period_days': 4.23,
-            'planet_radius_jupiter': 1.2,
-            'planet_mass_jupiter': 0.47,
-            'orbital_distance_au': 0.0527,
-            'eccentricity': 0.013,
-            'equilibrium_temp_k': 1284,
-            'stellar_distance_pc': 15.4,
-            'stellar_mass_solar': 1.11,
-            'stellar_radius_solar': 1.24,
-            'stellar_temp_k': 5793,
-            'ra_deg': 344.4,
-            'dec_deg': 20.8,
-            'data_source': 'Demo Data'
-        },
-        {
-            'planet_name': 'HD 189733 b',
-            'host_star': 'HD 189733',
-            'discovery_method': 'Transit',
-            'discovery_year': 2005,
-            'orbital_period_days': 2.22,
-            'planet_radius_jupiter': 1.14,
-            'planet_mass_jupiter': 1.13,
-            'orbital_distance_au': 0.031,
-            'eccentricity': 0.0,
-            'equilibrium_temp_k': 1201,
-            'stellar_distance_pc': 19.8,
-            'stellar_mass_solar': 0.82,
-            'stellar_radius_solar': 0.76,
-            'stellar_temp_k': 4875,
-            'ra_deg': 300.2,
-            'dec_deg': 22.7,
-            'data_source': 'Demo Data'
-        }
-    ]
+    rng = np.random.default_rng(42)  # For reproducibility
     
     # Generate additional random planets
-    detection_methods = ['Transit', 'Radial Velocity', 'Direct Imaging', 'Microlensing', 'Transit Timing Variations']
-    
-    random_planets = []
-    for i in range(num_planets - len(famous_planets)):
-        # Generate random but realistic values
-        method = np.random.choice(detection_methods, p=[0.75, 0.15, 0.05, 0.03, 0.02])
-        year = np.random.randint(1995, 2024)
-        
-        # Planet properties (log-normal distributions for more realistic values)
-        radius_jup = np.random.lognormal(-1.0, 1.5)  # Mostly smaller planets
-        mass_jup = np.random.lognormal(-1.5, 1.5)
-        orbital_period = np.random.lognormal(1.0, 2.0)
-        orbital_distance = (orbital_period / 365.25) ** (2/3)  # Kepler's 3rd law approximation
-        
-        # Stellar properties
-        stellar_mass = np.random.lognormal(0.0, 0.3)  # Mostly Sun-like
-        stellar_radius = stellar_mass ** 0.8  # Mass-radius relation
-        stellar_temp = 5778 * (stellar_mass ** 0.5)  # Approximate
-        stellar_distance = np.random.lognormal(3.0, 1.5)  # Distance in parsecs
-        
-        # Calculate equilibrium temperature
+    detection_methods = np.array(['Transit', 'Radial Velocity', 'Direct Imaging', 'Microlensing', 'Transit Timing Variations'])
+    method_cdf = np.cumsum([0.75, 0.15, 0.05, 0.03, 0.02])
+    method_cdf[-1] = 1.0  # Guard against rounding in the cumulative sum
+    
+    n_random = max(num_planets - len(_FAMOUS_PLANETS), 0)
+    
+    # Generate random but realistic values, one array per column
+    # (detection method drawn by inverting the precomputed CDF)
+    method = detection_methods[np.searchsorted(method_cdf, rng.random(n_random), side='right')]
+    year = rng.integers(1995, 2024, n_random)
+    
+    # Planet properties (log-normal distributions for more realistic values)
+    radius_jup = rng.lognormal(-1.0, 1.5, n_random)  # Mostly smaller planets
+    mass_jup = rng.lognormal(-1.5, 1.5, n_random)
+    orbital_period = rng.lognormal(1.0, 2.0, n_random)
+    orbital_distance = np.cbrt((orbital_period / 365.25) ** 2)  # Kepler's 3rd law approximation
+    
+    # Stellar properties
+    stellar_mass = rng.lognormal(0.0, 0.3, n_random)  # Mostly Sun-like
+    stellar_radius = stellar_mass ** 0.8  # Mass-radius relation
+    stellar_temp = 5778 * np.sqrt(stellar_mass)  # Approximate
+    stellar_distance = rng.lognormal(3.0, 1.5, n_random)  # Distance in parsecs
+    
+    # Calculate equilibrium temperature
+    if _equilibrium_temp_jit is not None and n_random >= JIT_MIN_PLANETS:
+        eq_temp = _equilibrium_temp_jit(stellar_radius, stellar_temp, orbital_distance)
+    else:
         stellar_luminosity = (stellar_radius ** 2) * ((stellar_temp / 5778) ** 4)
-        eq_temp = 279 * (stellar_luminosity ** 0.25) / (orbital_distance ** 0.5)
-        
-        # Random sky position
-        ra = np.random.uniform(0, 360)
-        dec = np.random.uniform(-90, 90)
-        
-        random_planets.append({
-            'planet_name': f'Demo Planet {i+1:03d}',
-            'host_star': f'Demo Star {i+1:03d}',
-            'discovery_method': method,
-            'discovery_year': year,
-            'orbital_period_days': orbital_period,
-            'planet_radius_jupiter': radius_jup,
-            'planet_mass_jupiter': mass_jup,
-            'orbital_distance_au': orbital_distance,
-            'eccentricity': np.random.beta(1, 5),  # Most orbits are circular
-            'equilibrium_temp_k': eq_temp,
-            'stellar_distance_pc': stellar_distance,
-            'stellar_mass_solar': stellar_mass,
-            'stellar_radius_solar': stellar_radius,
-            'stellar_temp_k': stellar_temp,
-            'ra_deg': ra,
-            'dec_deg': dec,
-            'data_source': 'Demo Data'
-        })
+        eq_temp = 279 * np.sqrt(np.sqrt(stellar_luminosity)) / np.sqrt(orbital_distance)
     
-    # Combine famous and random planets
-    all_planets = famous_planets + random_planets
+    # Random sky position
+    ra = rng.uniform(0, 360, n_random)
+    dec = rng.uniform(-90, 90, n_random)
     
-    # Create DataFrame
-    df = pd.DataFrame(all_planets)
+    # Zero-padded 1-based ids for the planet and star names
+    ids = np.char.mod('%03d', np.arange(1, n_random + 1))
+    
+    random_planets = pd.DataFrame({
+        'planet_name': np.char.add('Demo Planet ', ids),
+        'host_star': np.char.add('Demo Star ', ids),
+        'discovery_method': method,
+        'discovery_year': year,
+        'orbital_period_days': orbital_period,
+        'planet_radius_jupiter': radius_jup,
+        'planet_mass_jupiter': mass_jup,
+        'orbital_distance_au': orbital_distance,
+        'eccentricity': rng.beta(1, 5, n_random),  # Most orbits are circular
+        'equilibrium_temp_k': eq_temp,
+        'stellar_distance_pc': stellar_distance,
+        'stellar_mass_solar': stellar_mass,
+        'stellar_radius_solar': stellar_radius,
+        'stellar_temp_k': stellar_temp,
+        'ra_deg': ra,
+        'dec_deg': dec,
+        'data_source': 'Demo Data'
+    })
+    
+    # Combine famous and random planets
+    df = pd.concat([_FAMOUS_PLANETS, random_planets], ignore_index=True)
     
     return df
 
 
-def save_demo_data(filename='demo_exoplanet_data.csv'):
-    """Generate and save demo data."""
+def save_demo_data(filename='demo_exoplanet_data.csv', csv_engine='pyarrow',
+                   formats=('csv', 'json', 'parquet')):
+    """Generate and save demo data as CSV, with JSON and Parquet copies."""
     print("Generating demo exoplanet data...")
     data = generate_demo_data(100)
     
-    data.to_csv(filename, index=False)
-    print(f"Saved {len(data)} demo planets to {filename}")
+    if 'csv' in formats:
+        save_csv(data, filename, engine=csv_engine)
+        print(f"Saved {len(data)} demo planets to {filename}")
     
     # Also save JSON version
-    json_filename = filename.replace('.csv', '.json')
-    data.to_json(json_filename, orient='records', indent=2)
-    print(f"Also saved to {json_filename}")
+    if 'json' in formats:
+        json_filename = filename.replace('.csv', '.json')
+        save_json_records(data, json_filename)
+        print(f"Also saved to {json_filename}")
+    
+    # And a Parquet version
+    if 'parquet' in formats:
+        parquet_filename = filename.replace('.csv', '.parquet')
+        try:
+            save_parquet(data, parquet_filename)
+            print(f"Also saved to {parquet_filename}")
+        except ImportError as e:
+            print(f"Skipped Parquet output (no Parquet engine installed): {e}")
     
     return data
 
@@ -9,6 +9,12 @@ This module provides unified access to multiple exoplanet databases:
 - TEPCat (Transiting Extrasolar Planet Catalogue)
 """
 
+import json
+import os
+import re
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 import requests
@@ -18,14 +24,148 @@ except ImportError:
     # Fallback for older astroquery versions
     from astroquery.nasa_exoplanet_archive import NasaExoplanetArchive
 from astropy.time import Time
-import warnings
-warnings.filterwarnings('ignore')
+from astropy.utils.exceptions import AstropyWarning
+from data_export import save_csv, save_json_records, save_parquet
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional; enrich_data falls back to plain NumPy
+    njit = None
+
+# The VOTable parser warns about archive units it does not recognise. The
+# filter is installed once here because warnings.catch_warnings() is not
+# thread-safe and fetch_all_sources runs the fetchers in threads.
+warnings.filterwarnings('ignore', category=AstropyWarning, module=r'astropy\.io\.votable')
+
+
+# Downloaded catalogues are cached here between runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'exoplanet')
+CACHE_MAX_AGE = 24 * 3600  # Seconds before the cached NASA table is refreshed
+
+# Columns of the unified schema, in output order
+UNIFIED_COLUMNS = [
+    'planet_name', 'host_star', 'discovery_method', 'discovery_year',
+    'orbital_period_days', 'planet_radius_jupiter', 'planet_mass_jupiter',
+    'orbital_distance_au', 'eccentricity', 'equilibrium_temp_k',
+    'stellar_distance_pc', 'stellar_mass_solar', 'stellar_radius_solar',
+    'stellar_temp_k', 'ra_deg', 'dec_deg', 'data_source'
+]
+
+# Text columns default to '' rather than NaN when absent from a source
+TEXT_COLUMNS = ['planet_name', 'host_star', 'discovery_method']
+
+# Repetitive text columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ['host_star', 'discovery_method', 'data_source']
+
+# NASA Exoplanet Archive (pscomppars) column -> unified column
+NASA_COLUMN_MAP = {
+    'pl_name': 'planet_name',
+    'hostname': 'host_star',
+    'discoverymethod': 'discovery_method',
+    'disc_year': 'discovery_year',
+    'pl_orbper': 'orbital_period_days',
+    'pl_radj': 'planet_radius_jupiter',
+    'pl_bmassj': 'planet_mass_jupiter',
+    'pl_orbsmax': 'orbital_distance_au',
+    'pl_orbeccen': 'eccentricity',
+    'pl_eqt': 'equilibrium_temp_k',
+    'sy_dist': 'stellar_distance_pc',
+    'st_mass': 'stellar_mass_solar',
+    'st_rad': 'stellar_radius_solar',
+    'st_teff': 'stellar_temp_k',
+    'ra': 'ra_deg',
+    'dec': 'dec_deg',
+}
+
+# Only the NASA columns the unified schema uses are requested from the archive
+NASA_FIELDS = ','.join(NASA_COLUMN_MAP)
 
+# EU Exoplanet Catalogue column -> unified column
+EU_COLUMN_MAP = {
+    'name': 'planet_name',
+    'star_name': 'host_star',
+    'detection_type': 'discovery_method',
+    'discovered': 'discovery_year',
+    'orbital_period': 'orbital_period_days',
+    'radius': 'planet_radius_jupiter',
+    'mass': 'planet_mass_jupiter',
+    'semi_major_axis': 'orbital_distance_au',
+    'eccentricity': 'eccentricity',
+    'temp_calculated': 'equilibrium_temp_k',
+    'star_distance': 'stellar_distance_pc',
+    'star_mass': 'stellar_mass_solar',
+    'star_radius': 'stellar_radius_solar',
+    'star_teff': 'stellar_temp_k',
+    'ra': 'ra_deg',
+    'dec': 'dec_deg',
+}
+
+# Comment prefix on EU CSV headers (older exports use '# name')
+EU_HEADER_PREFIX = re.compile(r'^#\s*')
+
+# Dtypes of the numeric EU columns
+EU_DTYPES = {col: 'float32' for col in EU_COLUMN_MAP
+             if col not in ('name', 'star_name', 'detection_type')}
+
+
+# Constants of mass * 1.898e27 / ((4/3) * pi * radius**3 * 1.4313e27) folded
+# together, so density = JUPITER_DENSITY_FACTOR * mass / radius**3 (Jupiter units)
+JUPITER_DENSITY_FACTOR = 1.898e27 / ((4/3) * np.pi * 1.4313e27)
+
+# Planet size classes by radius in Earth radii: <1.5, <2.0, <6.0, and above
+PLANET_TYPE_BOUNDS = np.array([1.5, 2.0, 6.0])
+PLANET_TYPE_LABELS = np.array(['Rocky (Earth-like)', 'Super-Earth', 'Neptune-like', 'Jupiter-like'])
+
+# Columns read by the fused enrichment kernel, and the minimum number of rows
+# for which it is used instead of the column-by-column NumPy path
+ENRICH_KERNEL_COLUMNS = [
+    'planet_radius_jupiter', 'planet_mass_jupiter', 'stellar_radius_solar',
+    'stellar_temp_k', 'orbital_distance_au', 'stellar_distance_pc', 'ra_deg', 'dec_deg'
+]
+JIT_MIN_PLANETS = 50_000
+
+if njit is not None:
+    # fastmath without 'nnan'/'ninf': missing values must keep IEEE semantics
+    @njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, cache=True)
+    def _enrich_kernel(radius_jup, mass_jup, stellar_radius, stellar_temp,
+                       orbital_distance, dist, ra_deg, dec_deg,
+                       radius_earth, mass_earth, density, hz_inner, hz_outer,
+                       in_hz, x_pc, y_pc, z_pc):
+        """Compute every numeric column of enrich_data in one pass over the rows."""
+        for i in prange(radius_jup.size):
+            radius_earth[i] = radius_jup[i] * 11.209
+            mass_earth[i] = mass_jup[i] * 317.8
+            if mass_jup[i] > 0 and radius_jup[i] > 0:
+                density[i] = JUPITER_DENSITY_FACTOR * mass_jup[i] / radius_jup[i] ** 3
+            else:
+                density[i] = np.nan
+            
+            sqrt_luminosity = abs(stellar_radius[i]) * (stellar_temp[i] / 5778.0) ** 2
+            hz_inner[i] = 0.95 * sqrt_luminosity
+            hz_outer[i] = 1.37 * sqrt_luminosity
+            in_hz[i] = orbital_distance[i] >= hz_inner[i] and orbital_distance[i] <= hz_outer[i]
+            
+            d = 100.0 if np.isnan(dist[i]) else dist[i]
+            ra = np.deg2rad(ra_deg[i])
+            dec = np.deg2rad(dec_deg[i])
+            d_cos_dec = d * np.cos(dec)
+            x_pc[i] = d_cos_dec * np.cos(ra)
+            y_pc[i] = d_cos_dec * np.sin(ra)
+            z_pc[i] = d * np.sin(dec)
+else:
+    _enrich_kernel = None
 
 class ExoplanetDataCollector:
     """Main class for collecting and integrating exoplanet data from multiple sources."""
     
-    def __init__(self):
+    def __init__(self, cache_dir=CACHE_DIR):
+        """
+        Parameters:
+        -----------
+        cache_dir : str or None
+            Directory for cached downloads (None disables caching)
+        """
+        self.cache_dir = cache_dir
         self.nasa_data = None
         self.eu_data = None
         self.oec_data = None
@@ -48,57 +188,186 @@ class ExoplanetDataCollector:
             print(f"Error loading demo data: {e}")
             return None
     
-    def fetch_nasa_exoplanet_archive(self):
+    def _cache_path(self, name):
+        """Return the path of a cache file, creating the cache directory if needed."""
+        if self.cache_dir is None:
+            return None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Cache directory unavailable, caching disabled: {e}")
+            return None
+        return os.path.join(self.cache_dir, name)
+    
+    def fetch_nasa_exoplanet_archive(self, force_refresh=False):
         """
         Fetch data from NASA Exoplanet Archive.
         Uses the Planetary Systems Composite Parameters table.
+        The table is cached on disk as Parquet and reused for CACHE_MAX_AGE
+        seconds unless force_refresh is set; an older cached copy is still
+        used if the archive query fails.
         """
         print("Fetching NASA Exoplanet Archive data...")
+        cache_file = self._cache_path('nasa_pscomppars.parquet')
+        if (not force_refresh and cache_file is not None and os.path.exists(cache_file)
+                and time.time() - os.path.getmtime(cache_file) < CACHE_MAX_AGE):
+            try:
+                self.nasa_data = pd.read_parquet(cache_file)
+                print(f"Loaded {len(self.nasa_data)} planets from NASA cache ({cache_file})")
+                return self.nasa_data
+            except Exception as e:
+                print(f"Could not read NASA cache, fetching instead: {e}")
+        
         try:
             # Get the composite planet data table
             self.nasa_data = NasaExoplanetArchive.query_criteria(
                 table="pscomppars",
-                select="*"
+                select=NASA_FIELDS
             ).to_pandas()
             
             print(f"Successfully fetched {len(self.nasa_data)} planets from NASA")
-            return self.nasa_data
         except Exception as e:
             print(f"Error fetching NASA data: {e}")
-            return None
+            if cache_file is None or not os.path.exists(cache_file):
+                return None
+            try:
+                self.nasa_data = pd.read_parquet(cache_file)
+            except Exception as e:
+                print(f"Could not read NASA cache: {e}")
+                return None
+            print(f"Loaded {len(self.nasa_data)} planets from NASA cache; using cached copy {cache_file}")
+            return self.nasa_data
+        
+        if cache_file is not None:
+            try:
+                save_parquet(self.nasa_data, cache_file)
+            except Exception as e:
+                print(f"Could not cache NASA data: {e}")
+        
+        return self.nasa_data
+    
+    @staticmethod
+    def _read_eu_csv(source):
+        """
+        Parse an EU catalogue CSV export, keeping only the columns used by
+        the unified schema and reading numeric ones directly as float32.
+        """
+        return pd.read_csv(source, engine='c', low_memory=False,
+                           usecols=lambda col: EU_HEADER_PREFIX.sub('', col) in EU_COLUMN_MAP,
+                           dtype=EU_DTYPES)
+    
+    @staticmethod
+    def _download_to_cache(url, cache_file, force_refresh=False):
+        """
+        Download url into cache_file, revalidating an existing copy with a
+        conditional GET (ETag / Last-Modified) unless force_refresh is set.
+        Returns True if the cached copy should be used: either it was still
+        current (HTTP 304) or the request failed and a cached copy exists.
+        """
+        meta_file = cache_file + '.json'
+        headers = {}
+        if not force_refresh and os.path.exists(cache_file) and os.path.exists(meta_file):
+            try:
+                with open(meta_file) as f:
+                    meta = json.load(f)
+            except (OSError, ValueError) as e:
+                # Unreadable metadata only costs the conditional request
+                print(f"Ignoring invalid cache metadata {meta_file}: {e}")
+                meta = {}
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        
+        try:
+            return ExoplanetDataCollector._stream_to_cache(url, cache_file, meta_file, headers)
+        except requests.RequestException as e:
+            if not os.path.exists(cache_file):
+                raise
+            print(f"Could not download {url} ({e}); using cached copy {cache_file}")
+            return True
+    
+    @staticmethod
+    def _stream_to_cache(url, cache_file, meta_file, headers):
+        """
+        Perform the (conditional) GET for _download_to_cache, writing a new
+        body and its validators to the cache. Returns True on HTTP 304.
+        """
+        # Stream the body rather than buffering the whole response in memory
+        with requests.get(url, headers=headers, timeout=30, stream=True) as response:
+            if response.status_code == 304:
+                return True
+            response.raise_for_status()
+            
+            # Stream to a temporary file so an interrupted download never
+            # replaces a complete cached copy
+            partial_file = cache_file + '.part'
+            with open(partial_file, 'wb') as f:
+                for block in response.iter_content(chunk_size=1 << 20):
+                    f.write(block)
+            os.replace(partial_file, cache_file)
+            with open(meta_file, 'w') as f:
+                json.dump({'url': url,
+                           'etag': response.headers.get('ETag'),
+                           'last_modified': response.headers.get('Last-Modified')}, f)
+        return False
     
-    def fetch_eu_exoplanet_catalogue(self):
+    def fetch_eu_exoplanet_catalogue(self, force_refresh=False):
         """
         Fetch data from the EU Exoplanet Catalogue (exoplanet.eu).
+        The CSV export is cached on disk and revalidated with a conditional
+        GET, so unchanged data is not downloaded again unless force_refresh
+        is set.
         """
         print("Fetching EU Exoplanet Catalogue data...")
         try:
             # EU catalogue CSV export URL
             url = "http://exoplanet.eu/catalog/csv"
-            response = requests.get(url, timeout=30)
+            cache_file = self._cache_path('eu_catalogue.csv')
             
-            if response.status_code == 200:
-                # Save temporarily and read as CSV
-                from io import StringIO
-                self.eu_data = pd.read_csv(StringIO(response.text))
-                print(f"Successfully fetched {len(self.eu_data)} planets from EU catalogue")
-                return self.eu_data
+            if cache_file is not None:
+                unchanged = self._download_to_cache(url, cache_file, force_refresh)
+                self.eu_data = self._read_eu_csv(cache_file)
+                if unchanged:
+                    print(f"Loaded {len(self.eu_data)} planets from EU cache")
+                    return self.eu_data
             else:
-                print(f"Failed to fetch EU data: HTTP {response.status_code}")
-                return None
+                with requests.get(url, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    # Parse straight from the socket, letting urllib3 undo
+                    # any gzip transfer encoding
+                    response.raw.decode_content = True
+                    self.eu_data = self._read_eu_csv(response.raw)
+            
+            print(f"Successfully fetched {len(self.eu_data)} planets from EU catalogue")
+            return self.eu_data
         except Exception as e:
             print(f"Error fetching EU data: {e}")
             return None
     
-    def fetch_open_exoplanet_catalogue(self):
+    def fetch_open_exoplanet_catalogue(self, force_refresh=False):
         """
         Fetch data from the Open Exoplanet Catalogue GitHub repository.
+        The compressed CSV is cached on disk like the EU export.
         """
         print("Fetching Open Exoplanet Catalogue data...")
         try:
             # OEC provides data in various formats; we'll use their CSV export
             url = "https://github.com/OpenExoplanetCatalogue/oec_gzip/raw/master/systems.csv"
-            self.oec_data = pd.read_csv(url, compression='gzip', error_bad_lines=False)
+            cache_file = self._cache_path('oec_systems.csv.gz')
+            source = url
+            if cache_file is not None:
+                self._download_to_cache(url, cache_file, force_refresh)
+                source = cache_file
+            try:
+                # pyarrow's multithreaded parser, skipping malformed rows
+                self.oec_data = pd.read_csv(source, compression='gzip',
+                                            engine='pyarrow', on_bad_lines='skip')
+            except (ImportError, ValueError):
+                # pyarrow is optional, and pandas < 2.1 rejects on_bad_lines
+                # with the pyarrow engine; fall back to pandas' C parser
+                self.oec_data = pd.read_csv(source, compression='gzip',
+                                            on_bad_lines='skip')
             print(f"Successfully fetched {len(self.oec_data)} systems from OEC")
             return self.oec_data
         except Exception as e:
@@ -106,6 +375,61 @@ class ExoplanetDataCollector:
             # Alternative: use a simplified approach
             return None
     
+    def fetch_all_sources(self, sources=('nasa', 'eu'), force_refresh=False):
+        """
+        Fetch several data sources concurrently.
+        
+        The fetches are network-bound, so running them in threads makes the
+        total wait roughly that of the slowest source instead of the sum.
+        
+        Parameters:
+        -----------
+        sources : sequence of str
+            Any of 'nasa', 'eu' and 'oec' (default: NASA and EU)
+        force_refresh : bool
+            Bypass the download cache
+        
+        Returns:
+        --------
+        dict
+            Source name -> fetched DataFrame (None if the fetch failed)
+        """
+        fetchers = {
+            'nasa': lambda: self.fetch_nasa_exoplanet_archive(force_refresh=force_refresh),
+            'eu': lambda: self.fetch_eu_exoplanet_catalogue(force_refresh=force_refresh),
+            'oec': lambda: self.fetch_open_exoplanet_catalogue(force_refresh=force_refresh),
+        }
+        with ThreadPoolExecutor(max_workers=max(len(sources), 1)) as executor:
+            futures = {name: executor.submit(fetchers[name]) for name in sources}
+        return {name: future.result() for name, future in futures.items()}
+    
+    @staticmethod
+    def _map_to_unified(source, column_map, data_source):
+        """
+        Rename a source table's columns to the unified schema.
+        Columns missing from the source are filled with '' (text) or NaN.
+        """
+        missing_text = {col: '' for source_col, col in column_map.items()
+                        if col in TEXT_COLUMNS and source_col not in source.columns}
+        unified = source.rename(columns=column_map).reindex(columns=UNIFIED_COLUMNS)
+        unified = unified.fillna(missing_text)
+        unified['data_source'] = data_source
+        return unified
+    
+    @staticmethod
+    def _downcast_columns(data):
+        """
+        Store float64 columns as float32 and discovery years as the smallest
+        integer type that fits (float32 if any year is missing).
+        Catalogue values rarely carry more than 7 significant digits, so
+        single precision halves memory without losing information.
+        """
+        float_cols = data.select_dtypes('float64').columns
+        data[float_cols] = data[float_cols].astype('float32')
+        if 'discovery_year' in data.columns:
+            data['discovery_year'] = pd.to_numeric(data['discovery_year'], downcast='integer')
+        return data
+    
     def create_unified_schema(self):
         """
         Create a unified schema from all data sources.
@@ -113,67 +437,51 @@ class ExoplanetDataCollector:
         """
         print("Creating unified data schema...")
         
-        unified_data = []
+        frames = []
         
         # Process NASA data
         if self.nasa_data is not None and len(self.nasa_data) > 0:
             # Check if this is demo data or real NASA data
             is_demo = 'data_source' in self.nasa_data.columns
             
-            for _, row in self.nasa_data.iterrows():
-                if is_demo:
-                    # Demo data already has the right format
-                    unified_data.append(dict(row))
-                else:
-                    # Real NASA data needs mapping
-                    unified_data.append({
-                        'planet_name': row.get('pl_name', ''),
-                        'host_star': row.get('hostname', ''),
-                        'discovery_method': row.get('discoverymethod', ''),
-                        'discovery_year': row.get('disc_year', np.nan),
-                        'orbital_period_days': row.get('pl_orbper', np.nan),
-                        'planet_radius_jupiter': row.get('pl_radj', np.nan),
-                        'planet_mass_jupiter': row.get('pl_bmassj', np.nan),
-                        'orbital_distance_au': row.get('pl_orbsmax', np.nan),
-                        'eccentricity': row.get('pl_orbeccen', np.nan),
-                        'equilibrium_temp_k': row.get('pl_eqt', np.nan),
-                        'stellar_distance_pc': row.get('sy_dist', np.nan),
-                        'stellar_mass_solar': row.get('st_mass', np.nan),
-                        'stellar_radius_solar': row.get('st_rad', np.nan),
-                        'stellar_temp_k': row.get('st_teff', np.nan),
-                        'ra_deg': row.get('ra', np.nan),
-                        'dec_deg': row.get('dec', np.nan),
-                        'data_source': 'NASA Exoplanet Archive'
-                    })
+            if is_demo:
+                # Demo data already has the right format
+                frames.append(self.nasa_data)
+            else:
+                # Real NASA data needs mapping
+                frames.append(self._map_to_unified(
+                    self.nasa_data, NASA_COLUMN_MAP, 'NASA Exoplanet Archive'
+                ))
         
         # Process EU data
         if self.eu_data is not None and len(self.eu_data) > 0:
-            # Map EU column names to unified schema
-            for _, row in self.eu_data.iterrows():
-                # Only add if not already in unified data (avoid duplicates)
-                planet_name = row.get('name', row.get('# name', ''))
-                if not any(p['planet_name'] == planet_name for p in unified_data):
-                    unified_data.append({
-                        'planet_name': planet_name,
-                        'host_star': row.get('star_name', ''),
-                        'discovery_method': row.get('detection_type', ''),
-                        'discovery_year': row.get('discovered', np.nan),
-                        'orbital_period_days': row.get('orbital_period', np.nan),
-                        'planet_radius_jupiter': row.get('radius', np.nan),
-                        'planet_mass_jupiter': row.get('mass', np.nan),
-                        'orbital_distance_au': row.get('semi_major_axis', np.nan),
-                        'eccentricity': row.get('eccentricity', np.nan),
-                        'equilibrium_temp_k': row.get('temp_calculated', np.nan),
-                        'stellar_distance_pc': row.get('star_distance', np.nan),
-                        'stellar_mass_solar': row.get('star_mass', np.nan),
-                        'stellar_radius_solar': row.get('star_radius', np.nan),
-                        'stellar_temp_k': row.get('star_teff', np.nan),
-                        'ra_deg': row.get('ra', np.nan),
-                        'dec_deg': row.get('dec', np.nan),
-                        'data_source': 'EU Exoplanet Catalogue'
-                    })
-        
-        self.combined_data = pd.DataFrame(unified_data)
+            # Strip the comment prefix older exports put on the first header
+            eu_data = self.eu_data.rename(
+                columns=lambda col: EU_HEADER_PREFIX.sub('', col).strip()
+            )
+            eu_unified = self._map_to_unified(
+                eu_data, EU_COLUMN_MAP, 'EU Exoplanet Catalogue'
+            )
+            
+            # Only add planets not already in unified data (avoid duplicates),
+            # using a hashed membership test rather than scanning earlier rows
+            seen = frames[0]['planet_name'] if frames else []
+            eu_unified = eu_unified[~eu_unified['planet_name'].isin(seen)]
+            eu_unified = eu_unified.drop_duplicates(subset='planet_name', keep='first')
+            frames.append(eu_unified)
+        
+        if frames:
+            self.combined_data = pd.concat(frames, ignore_index=True)
+            
+            # Low-cardinality text columns are stored as categoricals
+            for col in CATEGORICAL_COLUMNS:
+                if col in self.combined_data.columns:
+                    self.combined_data[col] = self.combined_data[col].astype('category')
+            
+            self._downcast_columns(self.combined_data)
+        else:
+            self.combined_data = pd.DataFrame()
+        
         print(f"Created unified dataset with {len(self.combined_data)} planets")
         
         return self.combined_data
@@ -188,6 +496,56 @@ class ExoplanetDataCollector:
         
         print("Enriching dataset with derived values...")
         
+        if (_enrich_kernel is not None and len(self.combined_data) >= JIT_MIN_PLANETS
+                and all(col in self.combined_data.columns for col in ENRICH_KERNEL_COLUMNS)):
+            self._enrich_with_kernel()
+        else:
+            self._enrich_with_numpy()
+        
+        # Derived columns computed in float64 are stored like the inputs
+        self._downcast_columns(self.combined_data)
+        
+        print("Data enrichment complete!")
+        
+        return self.combined_data
+    
+    def _enrich_with_kernel(self):
+        """Add the derived columns with the fused numba kernel (large datasets)."""
+        # Inputs are float32 after create_unified_schema, so these are views
+        inputs = [self.combined_data[col].to_numpy(dtype=np.float32)
+                  for col in ENRICH_KERNEL_COLUMNS]
+        n = len(self.combined_data)
+        radius_earth, mass_earth, density, hz_inner, hz_outer, x_pc, y_pc, z_pc = (
+            np.empty(n, dtype=np.float32) for _ in range(8)
+        )
+        in_hz = np.empty(n, dtype=np.bool_)
+        _enrich_kernel(*inputs, radius_earth, mass_earth, density, hz_inner, hz_outer,
+                       in_hz, x_pc, y_pc, z_pc)
+        
+        # Same column order as the NumPy path
+        self.combined_data['planet_radius_earth'] = radius_earth
+        self.combined_data['planet_mass_earth'] = mass_earth
+        self.combined_data['density_g_cm3'] = density
+        self._classify_planet_types()
+        self.combined_data['hz_inner_au'] = hz_inner
+        self.combined_data['hz_outer_au'] = hz_outer
+        self.combined_data['in_habitable_zone'] = in_hz
+        self.combined_data['x_pc'] = x_pc
+        self.combined_data['y_pc'] = y_pc
+        self.combined_data['z_pc'] = z_pc
+    
+    def _classify_planet_types(self):
+        """Classify planets by size (bin edges are lower bounds of each type)."""
+        radius_earth = self.combined_data['planet_radius_earth'].to_numpy(dtype=float)
+        type_index = np.searchsorted(PLANET_TYPE_BOUNDS, radius_earth, side='right')
+        # Build the categorical straight from integer codes ('Unknown' is last)
+        type_index[np.isnan(radius_earth)] = len(PLANET_TYPE_LABELS)
+        self.combined_data['planet_type'] = pd.Categorical.from_codes(
+            type_index, categories=[*PLANET_TYPE_LABELS, 'Unknown']
+        )
+    
+    def _enrich_with_numpy(self):
+        """Add the derived columns one NumPy expression at a time."""
         # Convert radius to Earth radii
         if 'planet_radius_jupiter' in self.combined_data.columns:
             self.combined_data['planet_radius_earth'] = (
@@ -202,75 +560,79 @@ class ExoplanetDataCollector:
         
         # Calculate density (if we have both mass and radius)
         if 'planet_mass_jupiter' in self.combined_data.columns and 'planet_radius_jupiter' in self.combined_data.columns:
-            volume_jupiter = (4/3) * np.pi * (self.combined_data['planet_radius_jupiter'] ** 3)
-            self.combined_data['density_g_cm3'] = np.where(
-                (self.combined_data['planet_mass_jupiter'] > 0) & 
-                (self.combined_data['planet_radius_jupiter'] > 0),
-                self.combined_data['planet_mass_jupiter'] * 1.898e27 / (volume_jupiter * 1.4313e27),
-                np.nan
-            )
+            mass_jup = self.combined_data['planet_mass_jupiter'].to_numpy(dtype=float)
+            radius_jup = self.combined_data['planet_radius_jupiter'].to_numpy(dtype=float)
+            valid = (mass_jup > 0) & (radius_jup > 0)
+            density = np.full_like(radius_jup, np.nan)
+            np.divide(JUPITER_DENSITY_FACTOR * mass_jup, radius_jup ** 3, out=density, where=valid)
+            self.combined_data['density_g_cm3'] = density
         
         # Classify planets by size
-        def classify_planet_type(radius_earth):
-            if pd.isna(radius_earth):
-                return 'Unknown'
-            elif radius_earth < 1.5:
-                return 'Rocky (Earth-like)'
-            elif radius_earth < 2.0:
-                return 'Super-Earth'
-            elif radius_earth < 6.0:
-                return 'Neptune-like'
-            else:
-                return 'Jupiter-like'
-        
         if 'planet_radius_earth' in self.combined_data.columns:
-            self.combined_data['planet_type'] = self.combined_data['planet_radius_earth'].apply(
-                classify_planet_type
-            )
+            self._classify_planet_types()
         
         # Estimate habitable zone distance (simplified)
         # HZ varies with stellar luminosity, roughly 0.95-1.37 AU for Sun-like stars
         if 'stellar_radius_solar' in self.combined_data.columns and 'stellar_temp_k' in self.combined_data.columns:
-            stellar_luminosity = (self.combined_data['stellar_radius_solar'] ** 2) * \
-                                ((self.combined_data['stellar_temp_k'] / 5778) ** 4)
-            self.combined_data['hz_inner_au'] = 0.95 * np.sqrt(stellar_luminosity)
-            self.combined_data['hz_outer_au'] = 1.37 * np.sqrt(stellar_luminosity)
-        
-        # Check if in habitable zone
-        if 'orbital_distance_au' in self.combined_data.columns and 'hz_inner_au' in self.combined_data.columns:
-            self.combined_data['in_habitable_zone'] = (
-                (self.combined_data['orbital_distance_au'] >= self.combined_data['hz_inner_au']) &
-                (self.combined_data['orbital_distance_au'] <= self.combined_data['hz_outer_au'])
-            )
+            stellar_radius = self.combined_data['stellar_radius_solar'].to_numpy()
+            stellar_temp = self.combined_data['stellar_temp_k'].to_numpy()
+            # sqrt(L) = sqrt(R^2 * (T/5778)^4) = |R| * (T/5778)^2, so no sqrt is needed
+            sqrt_luminosity = np.abs(stellar_radius) * (stellar_temp / 5778) ** 2
+            hz_inner = 0.95 * sqrt_luminosity
+            hz_outer = 1.37 * sqrt_luminosity
+            self.combined_data['hz_inner_au'] = hz_inner
+            self.combined_data['hz_outer_au'] = hz_outer
+            
+            # Check if in habitable zone
+            if 'orbital_distance_au' in self.combined_data.columns:
+                orbital_distance = self.combined_data['orbital_distance_au'].to_numpy()
+                self.combined_data['in_habitable_zone'] = (
+                    (orbital_distance >= hz_inner) & (orbital_distance <= hz_outer)
+                )
         
         # Calculate galactic coordinates (simplified - would need proper coordinate transformation)
         # For now, just convert RA/Dec to cartesian
         if 'ra_deg' in self.combined_data.columns and 'dec_deg' in self.combined_data.columns:
-            dist = self.combined_data['stellar_distance_pc'].fillna(100)  # Default to 100 pc if unknown
-            ra_rad = np.radians(self.combined_data['ra_deg'])
-            dec_rad = np.radians(self.combined_data['dec_deg'])
+            dist = self.combined_data['stellar_distance_pc'].fillna(100).to_numpy()  # Default to 100 pc if unknown
+            ra_rad = np.deg2rad(self.combined_data['ra_deg'].to_numpy())
+            dec_rad = np.deg2rad(self.combined_data['dec_deg'].to_numpy())
             
-            self.combined_data['x_pc'] = dist * np.cos(dec_rad) * np.cos(ra_rad)
-            self.combined_data['y_pc'] = dist * np.cos(dec_rad) * np.sin(ra_rad)
+            # Project distance onto the equatorial plane once and reuse it
+            dist_cos_dec = dist * np.cos(dec_rad)
+            self.combined_data['x_pc'] = dist_cos_dec * np.cos(ra_rad)
+            self.combined_data['y_pc'] = dist_cos_dec * np.sin(ra_rad)
             self.combined_data['z_pc'] = dist * np.sin(dec_rad)
-        
-        print("Data enrichment complete!")
-        
-        return self.combined_data
     
-    def save_data(self, filename='exoplanet_combined_data.csv'):
-        """Save the combined dataset to a CSV file."""
+    def save_data(self, filename='exoplanet_combined_data.csv', csv_engine='pyarrow',
+                  formats=('csv', 'json', 'parquet')):
+        """
+        Save the combined dataset as CSV, with JSON and Parquet copies.
+        The JSON and Parquet file names replace the .csv extension.
+        Set csv_engine='pandas' to write with DataFrame.to_csv instead of pyarrow.
+        Pass a subset of formats to skip some outputs.
+        """
         if self.combined_data is None:
             print("No data to save.")
             return
         
-        self.combined_data.to_csv(filename, index=False)
-        print(f"Data saved to {filename}")
+        if 'csv' in formats:
+            save_csv(self.combined_data, filename, engine=csv_engine)
+            print(f"Data saved to {filename}")
         
         # Also save a JSON version for web applications
-        json_filename = filename.replace('.csv', '.json')
-        self.combined_data.to_json(json_filename, orient='records', indent=2)
-        print(f"Data also saved to {json_filename}")
+        if 'json' in formats:
+            json_filename = filename.replace('.csv', '.json')
+            save_json_records(self.combined_data, json_filename)
+            print(f"Data also saved to {json_filename}")
+        
+        # And a Parquet version, which keeps dtypes and is much faster to reload
+        if 'parquet' in formats:
+            parquet_filename = filename.replace('.csv', '.parquet')
+            try:
+                save_parquet(self.combined_data, parquet_filename)
+                print(f"Data also saved to {parquet_filename}")
+            except ImportError as e:
+                print(f"Skipped Parquet output (no Parquet engine installed): {e}")
     
     def get_statistics(self):
         """Generate summary statistics about the combined dataset."""
@@ -284,22 +646,25 @@ class ExoplanetDataCollector:
         
         print(f"\nTotal planets: {len(self.combined_data)}")
         
+        # Categorical columns list every category in value_counts; the
+        # summaries below only show values that occur
         if 'data_source' in self.combined_data.columns:
             print("\nPlanets by source:")
-            print(self.combined_data['data_source'].value_counts())
+            print(self.combined_data['data_source'].value_counts()[lambda counts: counts > 0])
         
         if 'discovery_method' in self.combined_data.columns:
             print("\nPlanets by discovery method:")
-            print(self.combined_data['discovery_method'].value_counts().head(10))
+            print(self.combined_data['discovery_method'].value_counts()[lambda counts: counts > 0].head(10))
         
         if 'discovery_year' in self.combined_data.columns:
+            first, latest = self.combined_data['discovery_year'].agg(['min', 'max'])
             print("\nDiscovery year range:")
-            print(f"  First: {self.combined_data['discovery_year'].min()}")
-            print(f"  Latest: {self.combined_data['discovery_year'].max()}")
+            print(f"  First: {first}")
+            print(f"  Latest: {latest}")
         
         if 'planet_type' in self.combined_data.columns:
             print("\nPlanets by type:")
-            print(self.combined_data['planet_type'].value_counts())
+            print(self.combined_data['planet_type'].value_counts()[lambda counts: counts > 0])
         
         if 'in_habitable_zone' in self.combined_data.columns:
             hz_count = self.combined_data['in_habitable_zone'].sum()
@@ -308,10 +673,11 @@ class ExoplanetDataCollector:
         print("\nData completeness:")
         key_columns = ['planet_radius_jupiter', 'planet_mass_jupiter', 
                       'orbital_period_days', 'orbital_distance_au']
-        for col in key_columns:
-            if col in self.combined_data.columns:
-                completeness = (1 - self.combined_data[col].isna().sum() / len(self.combined_data)) * 100
-                print(f"  {col}: {completeness:.1f}%")
+        key_columns = [col for col in key_columns if col in self.combined_data.columns]
+        # One pass over all key columns instead of one scan per column
+        completeness = (1 - self.combined_data[key_columns].isna().mean()) * 100
+        for col, percent in completeness.items():
+            print(f"  {col}: {percent:.1f}%")
         
         print("="*60 + "\n")
 
@@ -321,17 +687,8 @@ def main():
     collector = ExoplanetDataCollector()
     
     # Try to fetch from all sources, fall back to demo data if needed
-    success = False
-    
-    # Try NASA
-    nasa_result = collector.fetch_nasa_exoplanet_archive()
-    if nasa_result is not None and len(nasa_result) > 0:
-        success = True
-    
-    # Try EU
-    eu_result = collector.fetch_eu_exoplanet_catalogue()
-    if eu_result is not None and len(eu_result) > 0:
-        success = True
+    results = collector.fetch_all_sources()
+    success = any(result is not None and len(result) > 0 for result in results.values())
     
     # If no data collected, use demo data
     if not success:
@@ -9,25 +9,110 @@ Provides comprehensive visualization tools for exoplanet data including:
 - Habitable zone visualization
 """
 
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
 import pandas as pd
 import numpy as np
+import matplotlib
+# Static figures are only saved to PNG, so use the non-GUI Agg backend
+# unless a backend was chosen explicitly (Jupyter sets MPLBACKEND) or
+# EXO_INTERACTIVE=1 asks for the default one
+if 'MPLBACKEND' not in os.environ and os.environ.get('EXO_INTERACTIVE') != '1':
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-import warnings
-warnings.filterwarnings('ignore')
+from data_export import load_saved_data
+try:
+    import datashader as ds
+    import datashader.transfer_functions as tf
+except ImportError:
+    # datashader is optional; large scatters are drawn point by point
+    ds = None
 
 # Set style
 sns.set_style("darkgrid")
 plt.rcParams['figure.figsize'] = (12, 8)
 
+# Scatter plots with at least this many points are drawn with WebGL;
+# SVG is lighter for small plots
+WEBGL_MIN_POINTS = 5000
+
+# Mass-radius diagrams with at least this many points are rasterized with
+# datashader, keeping only the most massive planets as hoverable markers
+RASTERIZE_MIN_POINTS = 100_000
+RASTER_HOVER_POINTS = 2000
+
+# Above this many points, scatter hover text shows only the planet name,
+# since per-point hover columns would dominate the HTML size
+HOVER_DATA_MAX_POINTS = 50_000
+
+# Histogram bin widths are estimated (Freedman-Diaconis) on at most this
+# many values, and capped at MAX_HISTOGRAM_BINS bins
+HISTOGRAM_SAMPLE_SIZE = 100_000
+MAX_HISTOGRAM_BINS = 100
+
+# The 3D view is downsampled to about this many points, keeping every
+# planet type represented
+GALAXY_VIEW_MAX_POINTS = 20_000
+
+# Text columns with fewer distinct values than this fraction of the rows
+# are stored as categoricals by the visualizer
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Plot methods run by generate_all_visualizations, in output order
+ALL_PLOTS = (
+    'plot_3d_galaxy_view',
+    'plot_mass_radius_diagram',
+    'plot_discovery_timeline',
+    'plot_detection_methods',
+    'plot_habitable_zone_analysis',
+    'plot_stellar_properties',
+    'create_dashboard',
+)
+
+# Visualizer used by worker processes of generate_all_visualizations
+_worker_visualizer = None
+
+
+def _optimize_dtypes(data):
+    """
+    Return data with float64 columns downcast to float32 where the values
+    fit, and repetitive text columns (e.g. discovery_method) converted to
+    categoricals. Data that is already compact, such as the collector's
+    output or a Parquet load, is returned unchanged.
+    """
+    converted = {}
+    for col in data.select_dtypes(include=['float64']).columns:
+        downcast = pd.to_numeric(data[col], downcast='float')
+        if downcast.dtype != data[col].dtype:
+            converted[col] = downcast
+    for col in data.select_dtypes(include=['object', 'string']).columns:
+        if data[col].nunique() < CATEGORY_MAX_UNIQUE_RATIO * len(data):
+            converted[col] = data[col].astype('category')
+    return data.assign(**converted) if converted else data
+
+
+def _init_worker(data, include_plotlyjs):
+    """Create the worker process's visualizer once, from the pickled data."""
+    global _worker_visualizer
+    _worker_visualizer = ExoplanetVisualizer(data, include_plotlyjs=include_plotlyjs)
+
+
+def _run_plot(method_name):
+    """Run one plot method in a worker process; the figure is not returned."""
+    getattr(_worker_visualizer, method_name)()
+
 
 class ExoplanetVisualizer:
     """Main class for creating exoplanet data visualizations."""
     
-    def __init__(self, data):
+    def __init__(self, data, include_plotlyjs='cdn'):
         """
         Initialize visualizer with exoplanet data.
         
@@ -35,8 +120,178 @@ class ExoplanetVisualizer:
         -----------
         data : pandas.DataFrame
             Combined exoplanet dataset
+        include_plotlyjs : str or bool
+            How saved HTML files load plotly.js: 'cdn' (default) links the
+            CDN copy, keeping each file small but needing internet access
+            to view; True embeds the ~3.5 MB library for offline viewing
+        
+        Filtered views and counts shared between plots are computed on
+        first use and cached, so data should not be modified afterwards.
+        Data read from CSV is converted to compact dtypes first; the
+        caller's DataFrame is not modified.
+        """
+        self.data = _optimize_dtypes(data)
+        self.include_plotlyjs = include_plotlyjs
+    
+    @cached_property
+    def _coords_data(self):
+        """Planets with Cartesian coordinates."""
+        return self.data.dropna(subset=['x_pc', 'y_pc', 'z_pc'])
+    
+    @cached_property
+    def _mass_radius_data(self):
+        """Planets with both a mass and a radius."""
+        return self.data.dropna(subset=['planet_mass_earth', 'planet_radius_earth'])
+    
+    @cached_property
+    def _timeline_data(self):
+        """Planets with a discovery year."""
+        return self.data.dropna(subset=['discovery_year'])
+    
+    @cached_property
+    def _hz_data(self):
+        """Planets with an orbital distance and equilibrium temperature."""
+        return self.data.dropna(subset=['orbital_distance_au', 'equilibrium_temp_k'])
+    
+    @cached_property
+    def _stellar_data(self):
+        """Planets whose host star has a mass and temperature."""
+        return self.data.dropna(subset=['stellar_mass_solar', 'stellar_temp_k'])
+    
+    @cached_property
+    def _year_codes(self):
+        """Factorized discovery years of _timeline_data: (codes, sorted years)."""
+        return pd.factorize(self._timeline_data['discovery_year'], sort=True)
+    
+    @cached_property
+    def _yearly_counts(self):
+        """Discoveries per year, including planets without a detection method."""
+        years, year_values = self._year_codes
+        return pd.Series(np.bincount(years, minlength=len(year_values)),
+                         index=pd.Index(year_values, name='discovery_year'))
+    
+    @cached_property
+    def _discovery_counts(self):
         """
-        self.data = data
+        Discoveries per year (rows) and detection method (columns).
+        
+        Both keys are factorized and the pairs counted with one
+        np.bincount, avoiding a two-key groupby. Year/method pairs with no
+        discoveries are included as zeros; planets without a detection
+        method are left out, as in a groupby.
+        """
+        plot_data = self._timeline_data
+        years, year_values = self._year_codes
+        methods, method_values = pd.factorize(plot_data['discovery_method'], sort=True)
+        valid = methods >= 0
+        num_methods = len(method_values)
+        counts = np.bincount(years[valid] * num_methods + methods[valid],
+                             minlength=len(year_values) * num_methods)
+        return pd.DataFrame(counts.reshape(len(year_values), num_methods),
+                            index=pd.Index(year_values, name='discovery_year'),
+                            columns=pd.Index(method_values, name='discovery_method'))
+    
+    @cached_property
+    def _method_counts(self):
+        """Number of planets per discovery method, most common first (unused categories omitted)."""
+        return self.data['discovery_method'].value_counts()[lambda counts: counts > 0]
+    
+    @cached_property
+    def _type_counts(self):
+        """Number of planets per planet type, most common first (unused categories omitted)."""
+        return self.data['planet_type'].value_counts()[lambda counts: counts > 0]
+    
+    @staticmethod
+    def _render_mode(num_points):
+        """Return the Plotly scatter render mode for a plot of num_points."""
+        return 'webgl' if num_points >= WEBGL_MIN_POINTS else 'svg'
+    
+    @staticmethod
+    def _hover_args(num_points, hover_columns):
+        """Return Plotly Express hover keywords for a scatter of num_points."""
+        if num_points < HOVER_DATA_MAX_POINTS:
+            return {'hover_data': hover_columns}
+        return {'hover_name': 'planet_name'}
+    
+    @staticmethod
+    def _rasterize(data, x, y, category, color_key, width=800, height=600):
+        """
+        Aggregate a log-log scatter into an image with datashader.
+        
+        Parameters:
+        -----------
+        data : pandas.DataFrame
+            Points to aggregate
+        x, y : str
+            Column names of the coordinates (both plotted on log axes)
+        category : str
+            Column whose categories colour the points
+        color_key : dict
+            Plotly 'rgb(...)' colour for each category
+        width, height : int
+            Size of the raster in pixels
+        
+        Returns:
+        --------
+        dict
+            Keyword arguments for Figure.add_layout_image
+        """
+        data = data.loc[(data[x] > 0) & (data[y] > 0), [x, y, category]]
+        data[category] = pd.Categorical(data[category], categories=list(color_key))
+        x_range = (float(data[x].min()), float(data[x].max()))
+        y_range = (float(data[y].min()), float(data[y].max()))
+        
+        canvas = ds.Canvas(plot_width=width, plot_height=height,
+                           x_range=x_range, y_range=y_range,
+                           x_axis_type='log', y_axis_type='log')
+        agg = canvas.points(data, x, y, ds.count_cat(category))
+        rgb_key = {cat: tuple(int(v) for v in px.colors.unlabel_rgb(color))
+                   for cat, color in color_key.items()}
+        image = tf.shade(agg, color_key=rgb_key, how='eq_hist')
+        
+        # Layout images on log axes are positioned in log10 units
+        log_x = np.log10(x_range)
+        log_y = np.log10(y_range)
+        return dict(source=image.to_pil(), xref='x', yref='y',
+                    x=log_x[0], y=log_y[1],
+                    sizex=log_x[1] - log_x[0], sizey=log_y[1] - log_y[0],
+                    sizing='stretch', layer='below')
+        
+    @staticmethod
+    def _bin_edges(values, bins='fd', value_range=None):
+        """
+        Compute histogram bin edges for a NumPy array.
+        
+        The bin width is estimated on a random sample of at most
+        HISTOGRAM_SAMPLE_SIZE values, while the edges span the full
+        value_range (default: the data's minimum to maximum). Rules that
+        would give more than MAX_HISTOGRAM_BINS bins fall back to that
+        many equal-width bins.
+        """
+        if len(values) == 0:
+            return np.histogram_bin_edges(values, bins=1)
+        if value_range is None:
+            value_range = (values.min(), values.max())
+        sample = values
+        if len(values) > HISTOGRAM_SAMPLE_SIZE:
+            sample = np.random.default_rng(0).choice(values, HISTOGRAM_SAMPLE_SIZE, replace=False)
+        edges = np.histogram_bin_edges(sample, bins=bins, range=value_range)
+        if len(edges) - 1 > MAX_HISTOGRAM_BINS:
+            edges = np.linspace(value_range[0], value_range[1], MAX_HISTOGRAM_BINS + 1)
+        return edges
+    
+    def _draw_histogram(self, ax, values, bins='fd', value_range=None, **style):
+        """
+        Draw a histogram of values on ax as bars.
+        
+        The edges come from _bin_edges and the counts from np.histogram
+        directly on the NumPy array, skipping Axes.hist's input handling;
+        style keywords are passed to Axes.bar.
+        """
+        values = np.asarray(values)
+        edges = self._bin_edges(values, bins, value_range)
+        counts, edges = np.histogram(values, bins=edges)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **style)
         
     def plot_3d_galaxy_view(self, save_html=True):
         """
@@ -45,10 +300,28 @@ class ExoplanetVisualizer:
         print("Creating 3D galaxy view...")
         
         # Filter data with valid coordinates
-        plot_data = self.data.dropna(subset=['x_pc', 'y_pc', 'z_pc'])
+        plot_data = self._coords_data
         
         # Color by planet type or discovery method
         color_column = 'planet_type' if 'planet_type' in plot_data.columns else 'discovery_method'
+        if isinstance(plot_data[color_column].dtype, pd.CategoricalDtype):
+            color_codes = plot_data[color_column].cat.codes.to_numpy()
+        else:
+            # Same codes as astype('category').cat.codes, without building a Categorical
+            color_codes = pd.factorize(plot_data[color_column], sort=True)[0]
+        
+        # Large catalogues are sampled per colour class so that rare classes
+        # stay visible while the WebGL scene remains interactive
+        title = '3D Distribution of Exoplanets in Space'
+        total = len(plot_data)
+        if total > GALAXY_VIEW_MAX_POINTS:
+            per_class = GALAXY_VIEW_MAX_POINTS // max(1, len(np.unique(color_codes)))
+            order = np.random.default_rng(0).permutation(total)
+            rank = pd.Series(color_codes[order]).groupby(color_codes[order]).cumcount().to_numpy()
+            keep = np.sort(order[rank < per_class])
+            plot_data = plot_data.iloc[keep]
+            color_codes = color_codes[keep]
+            title += f' ({len(plot_data)}/{total} sampled)'
         
         # Create 3D scatter plot
         fig = go.Figure(data=[go.Scatter3d(
@@ -58,7 +331,7 @@ class ExoplanetVisualizer:
             mode='markers',
             marker=dict(
                 size=5,
-                color=plot_data[color_column].astype('category').cat.codes,
+                color=color_codes,
                 colorscale='Viridis',
                 showscale=True,
                 opacity=0.8,
@@ -82,7 +355,7 @@ class ExoplanetVisualizer:
         ))
         
         fig.update_layout(
-            title='3D Distribution of Exoplanets in Space',
+            title=title,
             scene=dict(
                 xaxis_title='X (parsecs)',
                 yaxis_title='Y (parsecs)',
@@ -96,7 +369,7 @@ class ExoplanetVisualizer:
         )
         
         if save_html:
-            fig.write_html('exoplanet_3d_view.html')
+            fig.write_html('exoplanet_3d_view.html', include_plotlyjs=self.include_plotlyjs)
             print("Saved to exoplanet_3d_view.html")
         
         return fig
@@ -107,7 +380,21 @@ class ExoplanetVisualizer:
         """
         print("Creating mass-radius diagram...")
         
-        plot_data = self.data.dropna(subset=['planet_mass_earth', 'planet_radius_earth'])
+        plot_data = self._mass_radius_data
+        colors = px.colors.qualitative.Set2
+        
+        # Very large catalogues are drawn as a density image, with markers
+        # (and hover text) only for the most massive planets
+        raster = None
+        category_orders = None
+        if ds is not None and len(plot_data) >= RASTERIZE_MIN_POINTS:
+            type_order = list(plot_data['planet_type'].astype('category').cat.categories)
+            color_key = dict(zip(type_order, itertools.cycle(colors)))
+            raster = self._rasterize(plot_data, 'planet_mass_earth',
+                                     'planet_radius_earth', 'planet_type', color_key)
+            plot_data = plot_data.nlargest(RASTER_HOVER_POINTS, 'planet_mass_earth')
+            # Give the markers the same colours as the image
+            category_orders = {'planet_type': type_order}
         
         fig = px.scatter(
             plot_data,
@@ -116,15 +403,22 @@ class ExoplanetVisualizer:
             color='planet_type',
             log_x=True,
             log_y=True,
-            hover_data=['planet_name', 'host_star', 'discovery_method'],
+            **self._hover_args(len(plot_data), ['planet_name', 'host_star', 'discovery_method']),
+            render_mode=self._render_mode(len(plot_data)),
             title='Exoplanet Mass-Radius Diagram',
             labels={
                 'planet_mass_earth': 'Mass (Earth masses)',
                 'planet_radius_earth': 'Radius (Earth radii)',
                 'planet_type': 'Planet Type'
             },
-            color_discrete_sequence=px.colors.qualitative.Set2
+            category_orders=category_orders,
+            color_discrete_sequence=colors
         )
+        if raster is not None:
+            # Autorange only sees the markers, so fit the axes to the image
+            fig.add_layout_image(**raster)
+            fig.update_xaxes(range=[raster['x'], raster['x'] + raster['sizex']])
+            fig.update_yaxes(range=[raster['y'] - raster['sizey'], raster['y']])
         
         # Add reference lines for Earth and Jupiter
         fig.add_hline(y=1, line_dash="dash", line_color="green", 
@@ -143,7 +437,7 @@ class ExoplanetVisualizer:
         )
         
         if save_html:
-            fig.write_html('exoplanet_mass_radius.html')
+            fig.write_html('exoplanet_mass_radius.html', include_plotlyjs=self.include_plotlyjs)
             print("Saved to exoplanet_mass_radius.html")
         
         return fig
@@ -154,10 +448,8 @@ class ExoplanetVisualizer:
         """
         print("Creating discovery timeline...")
         
-        plot_data = self.data.dropna(subset=['discovery_year'])
-        
         # Count discoveries by year and method
-        timeline = plot_data.groupby(['discovery_year', 'discovery_method']).size().reset_index(name='count')
+        timeline = self._discovery_counts.stack().rename('count').reset_index()
         
         fig = px.area(
             timeline,
@@ -181,18 +473,19 @@ class ExoplanetVisualizer:
         )
         
         if save_html:
-            fig.write_html('exoplanet_discovery_timeline.html')
+            fig.write_html('exoplanet_discovery_timeline.html', include_plotlyjs=self.include_plotlyjs)
             print("Saved to exoplanet_discovery_timeline.html")
         
         return fig
     
-    def plot_detection_methods(self):
+    def plot_detection_methods(self, dpi=300):
         """
         Create pie chart and bar chart of detection methods.
+        Lower dpi (e.g. 150) saves the PNG faster, at web resolution.
         """
         print("Creating detection method analysis...")
         
-        method_counts = self.data['discovery_method'].value_counts()
+        method_counts = self._method_counts
         
         # Create subplots
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
@@ -210,7 +503,7 @@ class ExoplanetVisualizer:
         ax2.grid(axis='x', alpha=0.3)
         
         plt.tight_layout()
-        plt.savefig('detection_methods.png', dpi=300, bbox_inches='tight')
+        plt.savefig('detection_methods.png', dpi=dpi, bbox_inches='tight')
         print("Saved to detection_methods.png")
         
         return fig
@@ -221,7 +514,7 @@ class ExoplanetVisualizer:
         """
         print("Creating habitable zone analysis...")
         
-        plot_data = self.data.dropna(subset=['orbital_distance_au', 'equilibrium_temp_k'])
+        plot_data = self._hz_data
         
         # Create scatter plot
         fig = px.scatter(
@@ -230,7 +523,8 @@ class ExoplanetVisualizer:
             y='equilibrium_temp_k',
             color='in_habitable_zone',
             size='planet_radius_earth',
-            hover_data=['planet_name', 'host_star', 'planet_type'],
+            **self._hover_args(len(plot_data), ['planet_name', 'host_star', 'planet_type']),
+            render_mode=self._render_mode(len(plot_data)),
             log_x=True,
             title='Exoplanet Orbital Distance vs. Temperature (Habitable Zone)',
             labels={
@@ -254,24 +548,25 @@ class ExoplanetVisualizer:
         )
         
         if save_html:
-            fig.write_html('exoplanet_habitable_zone.html')
+            fig.write_html('exoplanet_habitable_zone.html', include_plotlyjs=self.include_plotlyjs)
             print("Saved to exoplanet_habitable_zone.html")
         
         return fig
     
-    def plot_stellar_properties(self):
+    def plot_stellar_properties(self, dpi=300):
         """
         Analyze host star properties.
+        Lower dpi (e.g. 150) saves the PNG faster, at web resolution.
         """
         print("Creating stellar properties analysis...")
         
-        plot_data = self.data.dropna(subset=['stellar_mass_solar', 'stellar_temp_k'])
+        plot_data = self._stellar_data
         
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         
         # Stellar mass distribution
-        axes[0, 0].hist(plot_data['stellar_mass_solar'], bins=50, 
-                       color='orange', alpha=0.7, edgecolor='black')
+        self._draw_histogram(axes[0, 0], plot_data['stellar_mass_solar'],
+                             color='orange', alpha=0.7, edgecolor='black')
         axes[0, 0].axvline(1.0, color='red', linestyle='--', linewidth=2, label='Sun')
         axes[0, 0].set_xlabel('Stellar Mass (Solar masses)', fontsize=11)
         axes[0, 0].set_ylabel('Count', fontsize=11)
@@ -280,8 +575,8 @@ class ExoplanetVisualizer:
         axes[0, 0].grid(alpha=0.3)
         
         # Stellar temperature distribution
-        axes[0, 1].hist(plot_data['stellar_temp_k'], bins=50,
-                       color='skyblue', alpha=0.7, edgecolor='black')
+        self._draw_histogram(axes[0, 1], plot_data['stellar_temp_k'],
+                             color='skyblue', alpha=0.7, edgecolor='black')
         axes[0, 1].axvline(5778, color='red', linestyle='--', linewidth=2, label='Sun')
         axes[0, 1].set_xlabel('Stellar Temperature (K)', fontsize=11)
         axes[0, 1].set_ylabel('Count', fontsize=11)
@@ -304,24 +599,29 @@ class ExoplanetVisualizer:
         axes[1, 0].grid(alpha=0.3)
         
         # Distance distribution
-        dist_data = self.data.dropna(subset=['stellar_distance_pc'])
-        axes[1, 1].hist(dist_data['stellar_distance_pc'], bins=50,
-                       color='green', alpha=0.7, edgecolor='black')
+        # Only the distance column is needed, so filter it alone
+        distances = self.data['stellar_distance_pc'].dropna()
+        max_distance = distances.quantile(0.95)
+        # Only the nearest 95% are shown, so size the bins for that range
+        self._draw_histogram(axes[1, 1], distances, value_range=(0, max_distance),
+                             color='green', alpha=0.7, edgecolor='black')
         axes[1, 1].set_xlabel('Distance (parsecs)', fontsize=11)
         axes[1, 1].set_ylabel('Count', fontsize=11)
         axes[1, 1].set_title('Distribution of Host Star Distances', fontsize=12, fontweight='bold')
-        axes[1, 1].set_xlim(0, dist_data['stellar_distance_pc'].quantile(0.95))
+        axes[1, 1].set_xlim(0, max_distance)
         axes[1, 1].grid(alpha=0.3)
         
         plt.tight_layout()
-        plt.savefig('stellar_properties.png', dpi=300, bbox_inches='tight')
+        plt.savefig('stellar_properties.png', dpi=dpi, bbox_inches='tight')
         print("Saved to stellar_properties.png")
         
         return fig
     
-    def create_dashboard(self, save_html=True):
+    def create_dashboard(self, save_html=True, full_html=True):
         """
         Create a comprehensive interactive dashboard with multiple views.
+        Set full_html=False to save a <div> fragment for embedding in
+        another page.
         """
         print("Creating comprehensive dashboard...")
         
@@ -329,8 +629,8 @@ class ExoplanetVisualizer:
         from plotly.subplots import make_subplots
         
         # Prepare data
-        method_counts = self.data['discovery_method'].value_counts().head(8)
-        type_counts = self.data['planet_type'].value_counts()
+        method_counts = self._method_counts.head(8)
+        type_counts = self._type_counts
         
         # Create figure with subplots
         fig = make_subplots(
@@ -358,8 +658,8 @@ class ExoplanetVisualizer:
         )
         
         # 3. Discovery timeline
-        timeline_data = self.data.dropna(subset=['discovery_year'])
-        yearly_counts = timeline_data.groupby('discovery_year').size().reset_index(name='count')
+        # Yearly totals share the factorized years with the timeline plot
+        yearly_counts = self._yearly_counts.reset_index(name='count')
         fig.add_trace(
             go.Scatter(x=yearly_counts['discovery_year'], 
                       y=yearly_counts['count'],
@@ -370,9 +670,10 @@ class ExoplanetVisualizer:
         )
         
         # 4. Mass vs Radius
-        mr_data = self.data.dropna(subset=['planet_mass_earth', 'planet_radius_earth'])
+        mr_data = self._mass_radius_data
+        scatter = go.Scattergl if self._render_mode(len(mr_data)) == 'webgl' else go.Scatter
         fig.add_trace(
-            go.Scatter(x=mr_data['planet_mass_earth'],
+            scatter(x=mr_data['planet_mass_earth'],
                       y=mr_data['planet_radius_earth'],
                       mode='markers',
                       name='Planets',
@@ -395,26 +696,45 @@ class ExoplanetVisualizer:
         )
         
         if save_html:
-            fig.write_html('exoplanet_dashboard.html')
+            fig.write_html('exoplanet_dashboard.html',
+                           include_plotlyjs=self.include_plotlyjs, full_html=full_html)
             print("Saved to exoplanet_dashboard.html")
         
         return fig
     
-    def generate_all_visualizations(self):
+    def generate_all_visualizations(self, max_workers=1):
         """
         Generate all available visualizations.
+        
+        The plots are independent, so they can optionally be rendered in
+        parallel worker processes, each receiving one copy of the data.
+        Workers are started with the 'spawn' method: forking is unsafe once
+        numba's thread pool is running, and scripts using workers need an
+        ``if __name__ == '__main__':`` guard on every platform.
+        
+        Parameters:
+        -----------
+        max_workers : int or None
+            Number of worker processes (None: one per CPU, at most one per
+            plot). With 1 (default), the plots are rendered in this process.
         """
         print("\n" + "="*60)
         print("GENERATING ALL VISUALIZATIONS")
         print("="*60 + "\n")
         
-        self.plot_3d_galaxy_view()
-        self.plot_mass_radius_diagram()
-        self.plot_discovery_timeline()
-        self.plot_detection_methods()
-        self.plot_habitable_zone_analysis()
-        self.plot_stellar_properties()
-        self.create_dashboard()
+        if max_workers is None:
+            max_workers = min(len(ALL_PLOTS), os.cpu_count() or 1)
+        
+        if max_workers <= 1:
+            for method_name in ALL_PLOTS:
+                getattr(self, method_name)()
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_worker,
+                                     initargs=(self.data, self.include_plotlyjs)) as executor:
+                # Consume the results so that errors in workers are raised here
+                list(executor.map(_run_plot, ALL_PLOTS))
         
         print("\n" + "="*60)
         print("ALL VISUALIZATIONS COMPLETE!")
@@ -425,7 +745,7 @@ def main():
     """Main function to demonstrate visualization."""
     # Load data
     try:
-        data = pd.read_csv('exoplanet_combined_data.csv')
+        data = load_saved_data('exoplanet_combined_data.csv')
         print(f"Loaded {len(data)} planets from exoplanet_combined_data.csv")
     except FileNotFoundError:
         print("Error: exoplanet_combined_data.csv not found.")
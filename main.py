@@ -7,50 +7,40 @@ Usage:
     python main.py --visualize    # Generate visualizations
     python main.py --all          # Do both (default)
     python main.py --stats        # Show statistics only
+    python main.py --refresh      # Ignore cached downloads when collecting
 """
 
 import sys
 import argparse
 from exoplanet_data_sources import ExoplanetDataCollector
-from exoplanet_visualizations import ExoplanetVisualizer
-import pandas as pd
+from data_export import load_saved_data
 
 
-def collect_data(output_file='exoplanet_combined_data.csv'):
-    """Collect and integrate exoplanet data."""
+def collect_data(output_file='exoplanet_combined_data.csv', force_refresh=False):
+    """Collect and integrate exoplanet data (force_refresh bypasses the download cache)."""
     print("\n" + "="*70)
     print(" EXOPLANET DATA COLLECTION")
     print("="*70 + "\n")
     
     collector = ExoplanetDataCollector()
     
-    success = False
-    
-    # Fetch from all sources
-    print("Step 1: Fetching data from NASA Exoplanet Archive...")
-    nasa_data = collector.fetch_nasa_exoplanet_archive()
-    if nasa_data is not None and len(nasa_data) > 0:
-        success = True
-    
-    print("\nStep 2: Fetching data from EU Exoplanet Catalogue...")
-    eu_data = collector.fetch_eu_exoplanet_catalogue()
-    if eu_data is not None and len(eu_data) > 0:
-        success = True
+    # Fetch from all sources concurrently
+    print("Step 1: Fetching data from NASA Exoplanet Archive and EU Exoplanet Catalogue...")
+    results = collector.fetch_all_sources(force_refresh=force_refresh)
+    success = any(result is not None and len(result) > 0 for result in results.values())
     
     # If no data collected, use demo data
     if not success:
         print("\n" + "!"*70)
         print("! No network access or API errors - using demo data instead")
         print("!"*70 + "\n")
-        print("Step 3: Loading demo data...")
+        print("Step 2: Loading demo data...")
         collector.load_demo_data()
-        step_num = 4
-    else:
         step_num = 3
+    else:
+        step_num = 2
     
-    # Note: Uncomment to add more sources
-    # print("\nStep 3: Fetching data from Open Exoplanet Catalogue...")
-    # collector.fetch_open_exoplanet_catalogue()
+    # Note: Add 'oec' to fetch_all_sources(sources=...) to include more sources
     
     print(f"\nStep {step_num}: Creating unified schema...")
     collector.create_unified_schema()
@@ -71,19 +61,24 @@ def collect_data(output_file='exoplanet_combined_data.csv'):
     return collector.combined_data
 
 
-def generate_visualizations(data_file='exoplanet_combined_data.csv'):
-    """Generate all visualizations."""
+def generate_visualizations(data_file='exoplanet_combined_data.csv', data=None):
+    """Generate all visualizations (from data if given, else from data_file)."""
     print("\n" + "="*70)
     print(" EXOPLANET VISUALIZATION GENERATION")
     print("="*70 + "\n")
     
-    try:
-        data = pd.read_csv(data_file)
-        print(f"Loaded {len(data)} planets from {data_file}\n")
-    except FileNotFoundError:
-        print(f"Error: {data_file} not found!")
-        print("Please run with --collect first to collect data.")
-        return
+    if data is None:
+        try:
+            data = load_saved_data(data_file)
+            print(f"Loaded {len(data)} planets from {data_file}\n")
+        except FileNotFoundError:
+            print(f"Error: {data_file} not found!")
+            print("Please run with --collect first to collect data.")
+            return
+    
+    # Imported here so --collect and --stats skip loading the plotting
+    # libraries (plotly, matplotlib, seaborn)
+    from exoplanet_visualizations import ExoplanetVisualizer
     
     viz = ExoplanetVisualizer(data)
     viz.generate_all_visualizations()
@@ -103,10 +98,11 @@ def generate_visualizations(data_file='exoplanet_combined_data.csv'):
     print()
 
 
-def show_statistics(data_file='exoplanet_combined_data.csv'):
-    """Show statistics only."""
+def show_statistics(data_file='exoplanet_combined_data.csv', data=None):
+    """Show statistics only (from data if given, else from data_file)."""
     try:
-        data = pd.read_csv(data_file)
+        if data is None:
+            data = load_saved_data(data_file)
         collector = ExoplanetDataCollector()
         collector.combined_data = data
         collector.get_statistics()
@@ -127,6 +123,7 @@ Examples:
   python main.py --visualize        # Generate visualizations only
   python main.py --stats            # Show statistics only
   python main.py --all              # Run full pipeline (same as no args)
+  python main.py --collect --refresh  # Re-download instead of using the cache
         '''
     )
     
@@ -140,6 +137,8 @@ Examples:
                        help='Run full pipeline (collect + visualize)')
     parser.add_argument('--output', default='exoplanet_combined_data.csv',
                        help='Output file for combined data (default: exoplanet_combined_data.csv)')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore cached catalogue downloads and fetch fresh data')
     
     args = parser.parse_args()
     
@@ -152,14 +151,15 @@ Examples:
         show_statistics(args.output)
     elif args.collect and not args.visualize:
         # Only collect
-        collect_data(args.output)
+        collect_data(args.output, force_refresh=args.refresh)
     elif args.visualize and not args.collect:
         # Only visualize
         generate_visualizations(args.output)
     else:
         # Both collect and visualize (covers --all and default)
-        collect_data(args.output)
-        generate_visualizations(args.output)
+        # Reuse the collected data rather than reading the saved file back
+        data = collect_data(args.output, force_refresh=args.refresh)
+        generate_visualizations(args.output, data=data)
     
     print("\n✅ All done! Check the generated files for results.\n")
 
@@ -10,6 +10,7 @@ import numpy as np
 from demo_data_generator import generate_demo_data
 from exoplanet_data_sources import ExoplanetDataCollector
 from exoplanet_visualizations import ExoplanetVisualizer
+from data_export import load_saved_data
 
 
 def test_demo_data_generation():
@@ -51,6 +52,83 @@ def test_data_collection():
     return True
 
 
+def test_unified_schema_mapping():
+    """Test mapping of NASA and EU columns onto the unified schema."""
+    print("\nTesting unified schema mapping...")
+    collector = ExoplanetDataCollector()
+    collector.nasa_data = pd.DataFrame({
+        'pl_name': ['Planet A', 'Planet B'],
+        'hostname': ['Star A', 'Star B'],
+        'pl_radj': [1.0, np.nan],
+    })
+    collector.eu_data = pd.DataFrame({
+        '# name': ['Planet B', 'Planet C'],
+        'radius': [0.5, 0.3],
+    })
+    unified = collector.create_unified_schema()
+    
+    assert list(unified['planet_name']) == ['Planet A', 'Planet B', 'Planet C'], \
+        "EU planets already present in NASA data should be skipped"
+    assert unified['data_source'].iloc[0] == 'NASA Exoplanet Archive', "Should tag NASA rows"
+    assert unified['data_source'].iloc[2] == 'EU Exoplanet Catalogue', "Should tag EU rows"
+    assert np.isclose(unified['planet_radius_jupiter'].iloc[2], 0.3), "Should map EU radius column"
+    assert unified['host_star'].iloc[2] == '', "Missing text columns should default to ''"
+    assert unified['orbital_period_days'].isna().all(), "Missing numeric columns should be NaN"
+    
+    print("✓ Unified schema mapping works correctly")
+    return True
+
+
+def test_catalogue_cache_fallback():
+    """Test that a cached catalogue is used when revalidation fails."""
+    print("\nTesting catalogue cache fallback...")
+    import os
+    import tempfile
+    from unittest import mock
+    import requests
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        collector = ExoplanetDataCollector(cache_dir=cache_dir)
+        cache_file = os.path.join(cache_dir, 'eu_catalogue.csv')
+        with open(cache_file, 'w') as f:
+            f.write('# name,radius\nPlanet X,1.5\n')
+        
+        # Network failure with a corrupt metadata file
+        with open(cache_file + '.json', 'w') as f:
+            f.write('{not json')
+        with mock.patch('exoplanet_data_sources.requests.get',
+                        side_effect=requests.ConnectionError('offline')) as get:
+            data = collector.fetch_eu_exoplanet_catalogue()
+        assert get.called, "Should attempt to revalidate the cache"
+        assert data is not None, "Should fall back to the cached copy"
+        assert list(data['# name']) == ['Planet X'], "Should read the cached rows"
+        
+        # Cached copy still current
+        with open(cache_file + '.json', 'w') as f:
+            f.write('{"etag": "\\"abc\\""}')
+        collector.eu_data = None
+        with mock.patch('exoplanet_data_sources.requests.get') as get:
+            get.return_value.__enter__.return_value.status_code = 304
+            data = collector.fetch_eu_exoplanet_catalogue()
+        assert get.call_args.kwargs['headers'] == {'If-None-Match': '"abc"'}, \
+            "Should send the cached ETag"
+        assert data is not None and len(data) == 1, "Should load the unchanged cache"
+        
+        # Expired NASA cache with the archive unreachable
+        nasa_cache = os.path.join(cache_dir, 'nasa_pscomppars.parquet')
+        pd.DataFrame({'pl_name': ['Planet Y']}).to_parquet(nasa_cache)
+        os.utime(nasa_cache, (0, 0))
+        with mock.patch('exoplanet_data_sources.NasaExoplanetArchive.query_criteria',
+                        side_effect=requests.ConnectionError('offline')) as query:
+            data = collector.fetch_nasa_exoplanet_archive()
+        assert query.called, "Should query the archive when the cache has expired"
+        assert data is not None, "Should fall back to the expired cache"
+        assert list(data['pl_name']) == ['Planet Y'], "Should read the cached NASA rows"
+    
+    print("✓ Catalogue cache fallback works correctly")
+    return True
+
+
 def test_data_enrichment():
     """Test derived column calculations."""
     print("\nTesting data enrichment...")
@@ -82,6 +160,47 @@ def test_data_enrichment():
     return True
 
 
+def test_enrichment_kernel_matches_numpy():
+    """Test the numba enrichment kernel against the NumPy path."""
+    print("\nTesting numba enrichment kernel...")
+    import exoplanet_data_sources
+    if exoplanet_data_sources._enrich_kernel is None:
+        print("numba not installed; skipping kernel comparison")
+        return True
+    
+    data = generate_demo_data(500)
+    data.loc[::7, 'planet_radius_jupiter'] = np.nan
+    data.loc[::11, 'planet_mass_jupiter'] = np.nan
+    data.loc[::5, 'stellar_distance_pc'] = np.nan
+    data.loc[::13, 'stellar_temp_k'] = np.nan
+    
+    results = []
+    jit_min_planets = exoplanet_data_sources.JIT_MIN_PLANETS
+    for threshold in (len(data) + 1, 1):  # NumPy path, then kernel path
+        exoplanet_data_sources.JIT_MIN_PLANETS = threshold
+        try:
+            collector = ExoplanetDataCollector()
+            collector.nasa_data = data.copy()
+            collector.create_unified_schema()
+            results.append(collector.enrich_data())
+        finally:
+            exoplanet_data_sources.JIT_MIN_PLANETS = jit_min_planets
+    numpy_result, kernel_result = results
+    
+    assert list(kernel_result.columns) == list(numpy_result.columns), "Should add the same columns"
+    assert (kernel_result.dtypes == numpy_result.dtypes).all(), "Should use the same dtypes"
+    for col in numpy_result.select_dtypes(include='float').columns:
+        np.testing.assert_allclose(kernel_result[col], numpy_result[col], rtol=1e-6,
+                                   equal_nan=True, err_msg=col)
+    assert kernel_result['in_habitable_zone'].equals(numpy_result['in_habitable_zone']), \
+        "Habitable zone flags should match exactly"
+    assert kernel_result['planet_type'].equals(numpy_result['planet_type']), \
+        "Planet types should match exactly"
+    
+    print("✓ Numba enrichment kernel matches NumPy path")
+    return True
+
+
 def test_statistics():
     """Test statistics generation."""
     print("\nTesting statistics...")
@@ -93,6 +212,19 @@ def test_statistics():
     # This should not crash
     collector.get_statistics()
     
+    # Categories with no planets (here only gas giants remain) are not listed
+    import io
+    from contextlib import redirect_stdout
+    collector.combined_data = collector.combined_data[
+        collector.combined_data['planet_type'] == 'Jupiter-like'
+    ]
+    output = io.StringIO()
+    with redirect_stdout(output):
+        collector.get_statistics()
+    assert 'Super-Earth' not in output.getvalue(), "Unused planet types should not be listed"
+    viz = ExoplanetVisualizer(collector.combined_data)
+    assert list(viz._type_counts.index) == ['Jupiter-like'], "Pie counts should skip unused types"
+    
     print("✓ Statistics generation works correctly")
     return True
 
@@ -116,6 +248,7 @@ def test_data_export():
     # Verify files exist
     assert os.path.exists(test_file), "CSV file should be created"
     assert os.path.exists(test_file.replace('.csv', '.json')), "JSON file should be created"
+    assert os.path.exists(test_file.replace('.csv', '.parquet')), "Parquet file should be created"
     
     # Verify data can be loaded
     loaded_data = pd.read_csv(test_file)
@@ -125,11 +258,43 @@ def test_data_export():
     # Cleanup
     os.remove(test_file)
     os.remove(test_file.replace('.csv', '.json'))
+    os.remove(test_file.replace('.csv', '.parquet'))
     
     print("✓ Data export works correctly")
     return True
 
 
+def test_parquet_export():
+    """Test Parquet saving preserves dtypes."""
+    print("\nTesting Parquet export...")
+    import os
+    import tempfile
+    
+    collector = ExoplanetDataCollector()
+    collector.load_demo_data()
+    collector.create_unified_schema()
+    collector.enrich_data()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_file = os.path.join(temp_dir, 'test_exoplanet_data.csv')
+        parquet_file = test_file.replace('.csv', '.parquet')
+        collector.save_data(test_file, formats=('parquet',))
+        
+        assert os.path.exists(parquet_file), "Parquet file should be created"
+        assert os.listdir(temp_dir) == [os.path.basename(parquet_file)], \
+            "Only the requested formats should be written"
+        loaded_data = pd.read_parquet(parquet_file)
+        assert len(loaded_data) == len(collector.combined_data), "Should round-trip all rows"
+        assert loaded_data['planet_type'].dtype == 'category', "Should keep categorical columns"
+        
+        # load_saved_data reads the Parquet copy even when no CSV was written
+        loaded_data = load_saved_data(test_file)
+        assert loaded_data['planet_type'].dtype == 'category', "Should load the Parquet copy"
+    
+    print("✓ Parquet export works correctly")
+    return True
+
+
 def test_visualization_initialization():
     """Test visualization system initialization."""
     print("\nTesting visualization initialization...")
@@ -144,10 +309,47 @@ def test_visualization_initialization():
     assert viz.data is not None, "Visualizer should have data"
     assert len(viz.data) > 0, "Visualizer data should not be empty"
     
+    # Yearly totals include planets without a detection method
+    enriched = enriched.copy()
+    enriched.loc[::3, 'discovery_method'] = np.nan
+    viz = ExoplanetVisualizer(enriched)
+    expected = enriched.groupby('discovery_year').size()
+    assert viz._yearly_counts.to_dict() == expected.to_dict(), "Yearly totals should count every planet"
+    
     print("✓ Visualization initialization works correctly")
     return True
 
 
+def test_parallel_visualizations():
+    """Test rendering all visualizations in worker processes."""
+    print("\nTesting parallel visualization generation...")
+    import os
+    import tempfile
+    
+    collector = ExoplanetDataCollector()
+    collector.nasa_data = generate_demo_data(200)
+    collector.create_unified_schema()
+    viz = ExoplanetVisualizer(collector.enrich_data())
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            viz.generate_all_visualizations(max_workers=2)
+            written = set(os.listdir(temp_dir))
+        finally:
+            os.chdir(cwd)
+    
+    expected = {'exoplanet_3d_view.html', 'exoplanet_mass_radius.html',
+                'exoplanet_discovery_timeline.html', 'detection_methods.png',
+                'exoplanet_habitable_zone.html', 'stellar_properties.png',
+                'exoplanet_dashboard.html'}
+    assert expected <= written, f"Workers should write every plot, missing {expected - written}"
+    
+    print("✓ Parallel visualization generation works correctly")
+    return True
+
+
 def test_end_to_end():
     """Test complete end-to-end workflow."""
     print("\nTesting end-to-end workflow...")
@@ -176,6 +378,7 @@ def test_end_to_end():
     # Cleanup
     os.remove(test_file)
     os.remove(test_file.replace('.csv', '.json'))
+    os.remove(test_file.replace('.csv', '.parquet'))
     
     print("✓ End-to-end workflow works correctly")
     return True
@@ -190,10 +393,15 @@ def run_all_tests():
     tests = [
         test_demo_data_generation,
         test_data_collection,
+        test_unified_schema_mapping,
+        test_catalogue_cache_fallback,
         test_data_enrichment,
+        test_enrichment_kernel_matches_numpy,
         test_statistics,
         test_data_export,
+        test_parquet_export,
         test_visualization_initialization,
+        test_parallel_visualizations,
         test_end_to_end
     ]
     